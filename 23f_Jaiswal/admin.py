@@ -0,0 +1,248 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask_login import login_required, current_user
+from datetime import datetime
+from sqlalchemy import func
+
+from extensions import db
+from models import Activity, User, ParkingLot, ParkingSpot, Reservation
+from cache import get_lot_cache
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+
+@admin_bp.route('/dashboard')
+@login_required
+def admin_dashboard():
+    if not current_user.is_admin:
+        flash('Access denied', 'danger')
+        return redirect(url_for('user.user_dashboard'))
+    total_lots = ParkingLot.query.count()
+    total_spots = ParkingSpot.query.count()
+    occupied_spots = ParkingSpot.query.filter_by(status='O').count()
+    available_spots = total_spots - occupied_spots
+    users_count = User.query.filter_by(is_admin=False).count()
+    # Fetch all lots and their spots
+    parking_lots = ParkingLot.query.all()
+    for lot in parking_lots:
+        lot.spots = ParkingSpot.query.filter_by(lot_id=lot.id).all()
+    # Fetch recent activities (last 10)
+    recent_activities = Activity.query.order_by(Activity.timestamp.desc()).limit(10).all()
+    return render_template('admin/dashboard.html',
+                           total_lots=total_lots,
+                           total_spots=total_spots,
+                           occupied_spots=occupied_spots,
+                           available_spots=available_spots,
+                           users_count=users_count,
+                           parking_lots=parking_lots,
+                           recent_activities=recent_activities)
+
+
+@admin_bp.route('/parking-lots')
+@login_required
+def admin_parking_lots():
+    if not current_user.is_admin:
+        return redirect(url_for('user.user_dashboard'))
+    
+    parking_lots = ParkingLot.query.all()
+    return render_template('admin/parking_lots.html', parking_lots=parking_lots)
+
+@admin_bp.route('/parking-lot/add', methods=['GET', 'POST'])
+@login_required
+def add_parking_lot():
+    if not current_user.is_admin:
+        return redirect(url_for('user.user_dashboard'))
+    
+    if request.method == 'POST':
+        name = request.form.get('name')
+        prime_location = request.form.get('prime_location')
+        price = float(request.form.get('price'))
+        address = request.form.get('address')
+        pincode = request.form.get('pincode')
+        max_spots = int(request.form.get('max_spots'))
+        if ParkingLot.query.filter_by(name=name).first():
+            flash('Parking lot with this name already exists', 'danger')
+            return redirect(url_for('admin.add_parking_lot'))
+        if ParkingLot.query.filter(db.func.lower(ParkingLot.name) == db.func.lower(name)).first():
+            flash('Parking lot with this prime location already exists', 'danger')
+            return redirect(url_for('admin.add_parking_lot'))
+        
+        
+        # Create new parking lot
+        new_lot = ParkingLot(
+            name=name,
+            prime_location_name=prime_location,
+            price_per_hour=price,
+            address=address,
+            pincode=pincode,
+            maximum_spots=max_spots
+        )
+        db.session.add(new_lot)
+        db.session.commit()
+        
+        # Create parking spots for this lot
+        for i in range(1, max_spots + 1):
+            spot = ParkingSpot(lot_id=new_lot.id, spot_number=i, status='A')
+            db.session.add(spot)
+        
+        db.session.commit()
+        get_lot_cache().invalidate()
+        flash('Parking lot created successfully', 'success')
+        return redirect(url_for('admin.admin_parking_lots'))
+    
+    return render_template('admin/add_parking_lot.html')
+
+@admin_bp.route('/parking-lot/edit/<int:lot_id>', methods=['GET', 'POST'])
+@login_required
+def edit_parking_lot(lot_id):
+    if not current_user.is_admin:
+        return redirect(url_for('user.user_dashboard'))
+    
+    lot = ParkingLot.query.get_or_404(lot_id)
+    
+    if request.method == 'POST':
+        lot.name = request.form.get('name')
+        lot.prime_location_name = request.form.get('prime_location')
+        lot.price_per_hour = float(request.form.get('price'))
+        lot.address = request.form.get('address')
+        lot.pincode = request.form.get('pincode')
+        new_max_spots = int(request.form.get('max_spots'))
+        
+        # Handle increase or decrease in parking spots
+        current_spots = len(lot.spots)
+        if new_max_spots > current_spots:
+            # Add more spots
+            for i in range(current_spots + 1, new_max_spots + 1):
+                spot = ParkingSpot(lot_id=lot.id, spot_number=i, status='A')
+                db.session.add(spot)
+        elif new_max_spots < current_spots:
+            # Check if any spots to be removed are occupied
+            spots_to_remove = ParkingSpot.query.filter(
+                ParkingSpot.lot_id == lot.id,
+                ParkingSpot.spot_number > new_max_spots,
+                ParkingSpot.status == 'O'
+            ).first()
+            
+            if spots_to_remove:
+                flash('Cannot reduce spots. Some spots to be removed are occupied.', 'danger')
+                return redirect(url_for('admin.edit_parking_lot', lot_id=lot.id))
+            
+            # Remove excess spots
+            ParkingSpot.query.filter(
+                ParkingSpot.lot_id == lot.id,
+                ParkingSpot.spot_number > new_max_spots
+            ).delete()
+        
+        lot.maximum_spots = new_max_spots
+        db.session.commit()
+        get_lot_cache().invalidate()
+        flash('Parking lot updated successfully', 'success')
+        return redirect(url_for('admin.admin_parking_lots'))
+    
+    return render_template('admin/edit_parking_lot.html', lot=lot)
+
+@admin_bp.route('/parking-lot/delete/<int:lot_id>')
+@login_required
+def delete_parking_lot(lot_id):
+    if not current_user.is_admin:
+        return redirect(url_for('user.user_dashboard'))
+    
+    lot = ParkingLot.query.get_or_404(lot_id)
+    
+    # Check if any spots are occupied
+    occupied_spots = ParkingSpot.query.filter_by(lot_id=lot_id, status='O').count()
+    if occupied_spots > 0:
+        flash('Cannot delete parking lot. Some spots are occupied.', 'danger')
+        return redirect(url_for('admin.admin_parking_lots'))
+    
+    # Delete all reservations for spots in this lot
+    spot_ids = [spot.id for spot in lot.spots]
+    if spot_ids:
+        Reservation.query.filter(Reservation.spot_id.in_(spot_ids)).delete(synchronize_session=False)
+    db.session.delete(lot)
+    db.session.commit()
+    get_lot_cache().invalidate()
+    flash('Parking lot deleted successfully', 'success')
+    return redirect(url_for('admin.admin_parking_lots'))
+
+@admin_bp.route('/parking-spots/<int:lot_id>')
+@login_required
+def admin_parking_spots(lot_id):
+    if not current_user.is_admin:
+        return redirect(url_for('user.user_dashboard'))
+    
+    lot = ParkingLot.query.get_or_404(lot_id)
+    spots = ParkingSpot.query.filter_by(lot_id=lot_id).order_by(ParkingSpot.spot_number).all()
+    
+    # Get active reservations for occupied spots
+    active_reservations = {}
+    for spot in spots:
+        if spot.status == 'O':
+            reservation = Reservation.query.filter_by(spot_id=spot.id, is_active=True).first()
+            active_reservations[spot.spot_number] = reservation
+
+    return render_template('admin/parking_spots.html', lot=lot, spots=spots, active_reservations=active_reservations)
+
+@admin_bp.route('/users')
+@login_required
+def admin_users():
+    if not current_user.is_admin:
+        flash('Access denied', 'danger')
+        return redirect(url_for('user.user_dashboard'))
+    q = request.args.get('q', '').strip()
+    if q:
+        users = User.query.filter(
+            User.is_admin == False,
+            (
+                User.username.ilike(f'%{q}%') |
+                User.full_name.ilike(f'%{q}%') |
+                User.email.ilike(f'%{q}%')
+            )
+        ).all()
+    else:
+        users = User.query.filter_by(is_admin=False).all()
+    return render_template('admin/users.html', users=users)
+
+@admin_bp.route('/summary')
+@login_required
+def admin_summary():
+    if not current_user.is_admin:
+        flash('Access denied', 'danger')
+        return redirect(url_for('user.user_dashboard'))
+    # Get overall summary
+    total_lots = ParkingLot.query.count()
+    total_spots = ParkingSpot.query.count()
+    occupied_spots = ParkingSpot.query.filter_by(status='O').count()
+    available_spots = total_spots - occupied_spots
+    users_count = User.query.filter_by(is_admin=False).count()
+    # Get lot-wise summary
+    lots = ParkingLot.query.all()
+    lot_summary = []
+    for lot in lots:
+        lot_total_spots = ParkingSpot.query.filter_by(lot_id=lot.id).count()
+        lot_occupied_spots = ParkingSpot.query.filter_by(lot_id=lot.id, status='O').count()
+        lot_available_spots = lot_total_spots - lot_occupied_spots
+        lot_summary.append({
+            'name': lot.name,
+            'total': lot_total_spots,
+            'occupied': lot_occupied_spots,
+            'available': lot_available_spots,
+            'occupancy_rate': round((lot_occupied_spots / lot_total_spots) * 100 if lot_total_spots > 0 else 0, 2)
+        })
+    # Get revenue summary (if Reservation has total_cost)
+    total_revenue = db.session.query(func.sum(Reservation.total_cost)).scalar() or 0
+
+    # Calculate today's revenue (completed reservations today)
+    today = datetime.now().date()
+    today_revenue = db.session.query(func.sum(Reservation.total_cost)).filter(
+        Reservation.leaving_timestamp != None,
+        func.date(Reservation.leaving_timestamp) == today
+    ).scalar() or 0
+
+    return render_template('admin/summary.html', 
+                          total_lots=total_lots,
+                          total_spots=total_spots,
+                          occupied_spots=occupied_spots,
+                          available_spots=available_spots,
+                          users_count=users_count,
+                          lot_summary=lot_summary,
+                          total_revenue=total_revenue,
+                          today_revenue=today_revenue)
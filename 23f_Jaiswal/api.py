@@ -0,0 +1,54 @@
+from flask import Blueprint, jsonify
+from sqlalchemy import case, func
+
+from extensions import db
+from models import ParkingLot, ParkingSpot
+from cache import get_lot_cache
+
+api_bp = Blueprint('api', __name__, url_prefix='/api')
+
+@api_bp.route('/lots', methods=['GET'])
+def api_lots():
+    # Spot counts are always live; names and prices come from the warm cache
+    spot_counts = {
+        lot_id: (total, available or 0)
+        for lot_id, total, available in db.session.query(
+            ParkingLot.id,
+            func.count(ParkingSpot.id),
+            func.sum(case((ParkingSpot.status == 'A', 1), else_=0))
+        )
+        .outerjoin(ParkingSpot, ParkingLot.id == ParkingSpot.lot_id)
+        .group_by(ParkingLot.id)
+        .all()
+    }
+    result = []
+
+    for lot in get_lot_cache().lots(expected_ids=spot_counts):
+        if lot.id not in spot_counts:
+            # Added after the counts query ran; it will show up next time
+            continue
+        total_spots, available_spots = spot_counts[lot.id]
+        result.append({
+            'id': lot.id,
+            'name': lot.name,
+            'location': lot.location,
+            'price': lot.price,
+            'total_spots': total_spots,
+            'available_spots': available_spots
+        })
+
+    return jsonify(result)
+
+@api_bp.route('/spots/<int:lot_id>', methods=['GET'])
+def api_spots(lot_id):
+    spots = ParkingSpot.query.filter_by(lot_id=lot_id).all()
+    result = []
+
+    for spot in spots:
+        result.append({
+            'id': spot.id,
+            'spot_number': spot.spot_number,
+            'status': 'Available' if spot.status == 'A' else 'Occupied'
+        })
+
+    return jsonify(result)
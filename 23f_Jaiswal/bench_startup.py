@@ -0,0 +1,95 @@
+# Worker spin-up benchmark.
+#
+# Compares how long a worker takes to serve its first request when it
+#   * cold: starts a fresh interpreter, builds the app and warms up itself
+#   * preloaded: is forked from a master that already ran warm_up()
+# Run with `python bench_startup.py [--runs N] [--lots N]`.
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+COLD_WORKER = """
+import sys
+sys.path.insert(0, {here!r})
+from app import create_app
+app = create_app({config!r})
+response = app.test_client().get('/api/lots')
+assert response.status_code == 200, response.status_code
+"""
+
+def seed(config, lots):
+    from app import create_app, warm_up
+    from extensions import db
+    from models import ParkingLot, ParkingSpot
+
+    app = create_app(config)
+    warm_up(app)
+    with app.app_context():
+        for i in range(lots):
+            lot = ParkingLot(
+                name=f'Lot {i}',
+                prime_location_name=f'Area {i % 10}',
+                price_per_hour=20.0 + i,
+                address=f'{i} Main Road',
+                pincode='560001',
+                maximum_spots=20
+            )
+            db.session.add(lot)
+            db.session.flush()
+            for n in range(1, 21):
+                db.session.add(ParkingSpot(lot_id=lot.id, spot_number=n, status='A'))
+        db.session.commit()
+
+def bench_cold(config, runs):
+    code = COLD_WORKER.format(here=HERE, config=config)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def bench_preloaded(config, runs):
+    from app import create_app, warm_up
+
+    app = create_app(config)
+    warm_up(app)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            response = app.test_client().get('/api/lots')
+            os._exit(0 if response.status_code == 200 else 1)
+        _, status = os.waitpid(pid, 0)
+        timings.append(time.perf_counter() - start)
+        if status != 0:
+            raise SystemExit('preloaded worker failed to serve /api/lots')
+    return timings
+
+def report(label, timings):
+    print(f'{label:<10} median {statistics.median(timings) * 1000:8.1f} ms   '
+          f'min {min(timings) * 1000:8.1f} ms   max {max(timings) * 1000:8.1f} ms')
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--lots', type=int, default=50)
+    args = parser.parse_args()
+
+    sys.path.insert(0, HERE)
+    with tempfile.TemporaryDirectory() as tmp:
+        config = {'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'bench.db')}
+        seed(config, args.lots)
+        print(f'{args.runs} runs, {args.lots} lots, time to first /api/lots response')
+        report('cold', bench_cold(config, args.runs))
+        report('preloaded', bench_preloaded(config, args.runs))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import time
+import threading
+from collections import namedtuple
+
+from flask import current_app
+
+from models import ParkingLot
+
+LotInfo = namedtuple('LotInfo', ['id', 'name', 'location', 'address', 'pincode', 'price'])
+
+
+# Read-only snapshot of lot metadata, built by warm_up() and inherited by
+# forked workers; see LOT_CACHE_TTL in app.py for how stale it can get
+class LotCache:
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._lots = None
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        lots = {}
+        for lot in ParkingLot.query.order_by(ParkingLot.id).all():
+            lots[lot.id] = LotInfo(
+                id=lot.id,
+                name=lot.name,
+                location=lot.prime_location_name,
+                address=lot.address,
+                pincode=lot.pincode,
+                price=lot.price_per_hour,
+            )
+        # Swap in a new dict rather than mutating, so readers never see a half-built table
+        self._lots = lots
+        self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        self._loaded_at = None
+
+    def is_fresh(self):
+        loaded_at = self._loaded_at
+        return loaded_at is not None and time.monotonic() - loaded_at < self.ttl
+
+    def _ensure_fresh(self):
+        if self.is_fresh():
+            return
+        with self._lock:
+            if not self.is_fresh():
+                self.load()
+
+    def lots(self, expected_ids=None):
+        # Passing the lot ids seen in a live query forces a reload when lots
+        # were added or deleted by another worker since the last load
+        self._ensure_fresh()
+        lots = self._lots
+        if expected_ids is not None and set(lots) != set(expected_ids):
+            with self._lock:
+                self.load()
+                lots = self._lots
+        return list(lots.values())
+
+
+def get_lot_cache():
+    return current_app.extensions['lot_cache']
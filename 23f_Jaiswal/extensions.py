@@ -0,0 +1,7 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_login import LoginManager
+
+# Extensions are created unbound and attached to an app in create_app()
+db = SQLAlchemy()
+login_manager = LoginManager()
+login_manager.login_view = 'main.login'
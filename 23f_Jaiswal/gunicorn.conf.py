@@ -0,0 +1,4 @@
+bind = '0.0.0.0:5002'
+workers = 4
+# Import wsgi.py (and run warm_up) in the master before forking workers
+preload_app = True
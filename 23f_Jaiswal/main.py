@@ -0,0 +1,95 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask_login import login_user, login_required, logout_user, current_user
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from extensions import db
+from models import User, ParkingLot
+
+main_bp = Blueprint('main', __name__)
+
+@main_bp.route('/')
+def index():
+    return render_template('index.html')
+
+@main_bp.route('/search')
+def search():
+    query = request.args.get('q', '').strip()
+    results = []
+    if query:
+        results = ParkingLot.query.filter(
+            (ParkingLot.name.ilike(f'%{query}%')) |
+            (ParkingLot.prime_location_name.ilike(f'%{query}%'))
+        ).all()
+    return render_template('search_results.html', query=query, results=results)
+
+
+@main_bp.route('/login', methods=['GET', 'POST'])
+def login():
+    if current_user.is_authenticated:
+        if current_user.is_admin:
+            return redirect(url_for('admin.admin_dashboard'))
+        return redirect(url_for('user.user_dashboard'))
+    
+    if request.method == 'POST':
+        username = request.form.get('username')
+        password = request.form.get('password')
+        
+        user = User.query.filter_by(username=username).first()
+        if user and check_password_hash(user.password, password):
+            login_user(user)
+            flash('Login successful!', 'success')
+            
+            if user.is_admin:
+                return redirect(url_for('admin.admin_dashboard'))
+            return redirect(url_for('user.user_dashboard'))
+        else:
+            flash('Invalid username or password', 'danger')
+    
+    return render_template('login.html')
+
+@main_bp.route('/register', methods=['GET', 'POST'])
+def register():
+    if current_user.is_authenticated:
+        return redirect(url_for('user.user_dashboard'))
+    
+    if request.method == 'POST':
+        username = request.form.get('username')
+        full_name = request.form.get('name')
+        email = request.form.get('email')
+        phone = request.form.get('phone')
+        address = request.form.get('address')
+        pincode = request.form.get('pincode')
+        password = request.form.get('password')
+        
+        user_exists = User.query.filter((User.username == username) | (User.email == email)).first()
+        if user_exists:
+            flash('Username or email already exists', 'danger')
+        else:
+            new_user = User(
+                username=username,
+                full_name=full_name,
+                email=email,
+                phone=phone,
+                address=address,
+                pincode=pincode,
+                password=generate_password_hash(password),
+                is_admin=False
+            )
+            db.session.add(new_user)
+            db.session.commit()
+            flash('Registration successful! Please log in.', 'success')
+            return redirect(url_for('main.login'))
+    
+    return render_template('register.html')
+
+@main_bp.route('/logout')
+@login_required
+def logout():
+    logout_user()
+    flash('You have been logged out', 'success')
+    return redirect(url_for('main.index'))
+
+# Developer preview routes for templates not directly routed
+@main_bp.route('/preview/base')
+def preview_base():
+    return render_template('base.html')
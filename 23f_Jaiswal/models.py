@@ -0,0 +1,104 @@
+from flask_login import UserMixin
+from werkzeug.security import generate_password_hash
+from datetime import datetime
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from extensions import db, login_manager
+
+# Create models
+
+class Activity(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    action = db.Column(db.String(128), nullable=False)
+    details = db.Column(db.String(256), nullable=True)
+    user = db.relationship('User')
+
+    def __repr__(self):
+        return f'<Activity {self.action} by {self.user_id} at {self.timestamp}>'
+
+class User(db.Model, UserMixin):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), unique=True, nullable=False)
+    full_name = db.Column(db.String(120), nullable=True)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    phone = db.Column(db.String(20), nullable=True)
+    address = db.Column(db.String(200), nullable=True)
+    pincode = db.Column(db.String(20), nullable=True)
+    password = db.Column(db.String(120), nullable=False)
+    is_admin = db.Column(db.Boolean, default=False)
+    reservations = db.relationship('Reservation', backref='user', lazy=True)
+
+    def __repr__(self):
+        return f'<User {self.username}>'
+
+class ParkingLot(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    prime_location_name = db.Column(db.String(100), nullable=False)
+    price_per_hour = db.Column(db.Float, nullable=False)
+    address = db.Column(db.String(200), nullable=False)
+    pincode = db.Column(db.String(20), nullable=False)
+    maximum_spots = db.Column(db.Integer, nullable=False)
+    spots = db.relationship('ParkingSpot', backref='lot', lazy=True, cascade="all, delete-orphan")
+    
+    def __repr__(self):
+        return f'<ParkingLot {self.name}>'
+
+class ParkingSpot(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    lot_id = db.Column(db.Integer, db.ForeignKey('parking_lot.id'), nullable=False)
+    spot_number = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(1), default='A')  # 'A' for Available, 'O' for Occupied
+    reservations = db.relationship('Reservation', backref='spot', lazy=True)
+    
+    def __repr__(self):
+        return f'<ParkingSpot {self.spot_number} in Lot {self.lot_id}>'
+
+class Reservation(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    spot_id = db.Column(db.Integer, db.ForeignKey('parking_spot.id'), nullable=False)
+    parking_timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    leaving_timestamp = db.Column(db.DateTime, nullable=True)
+    total_cost = db.Column(db.Float, default=0.0)
+    is_active = db.Column(db.Boolean, default=True)
+    owner_name = db.Column(db.String(120), nullable=True)
+    vehicle_number = db.Column(db.String(32), nullable=True)
+    
+    def __repr__(self):
+        return f'<Reservation {self.id}>'
+
+@login_manager.user_loader
+def load_user(user_id):
+    return User.query.get(int(user_id))
+
+# Initialize database and create admin
+
+def create_tables():
+    # Same as db.create_all(), but table by table so that losing a race with
+    # another worker creating the schema ("table ... already exists") is harmless
+    for table in db.metadata.sorted_tables:
+        try:
+            table.create(db.engine, checkfirst=True)
+        except OperationalError:
+            if not inspect(db.engine).has_table(table.name):
+                raise
+    
+    # Create admin if not exists
+    admin = User.query.filter_by(username='admin').first()
+    if not admin:
+        admin = User(
+            username='admin',
+            email='admin@parking.com',
+            password=generate_password_hash('admin123'),
+            is_admin=True
+        )
+        db.session.add(admin)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Seeded concurrently by another worker
+            db.session.rollback()
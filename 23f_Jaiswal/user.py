@@ -0,0 +1,204 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask_login import login_required, current_user
+from werkzeug.security import generate_password_hash
+from datetime import datetime
+
+from extensions import db
+from models import User, ParkingLot, ParkingSpot, Reservation
+
+user_bp = Blueprint('user', __name__, url_prefix='/user')
+
+@user_bp.route('/find-parking')
+@login_required
+def find_parking():
+    if current_user.is_admin:
+        return redirect(url_for('admin.admin_dashboard'))
+    location = request.args.get('location', '').strip()
+    query = db.session.query(ParkingLot).join(ParkingSpot, ParkingLot.id == ParkingSpot.lot_id).filter(ParkingSpot.status == 'A')
+    if location:
+        query = query.filter(ParkingLot.prime_location_name.ilike(f'%{location}%'))
+    lots = query.group_by(ParkingLot.id).all()
+    return render_template('user/find_parking.html', lots=lots)
+
+@user_bp.route('/track-usage')
+@login_required
+def track_usage():
+    if current_user.is_admin:
+        return redirect(url_for('admin.admin_dashboard'))
+    # Get user's parking history
+    history = Reservation.query.filter_by(user_id=current_user.id, is_active=False).order_by(Reservation.parking_timestamp.desc()).all()
+    total_spent = sum([r.total_cost for r in history])
+    return render_template('user/track_usage.html', history=history, total_spent=total_spent)
+
+@user_bp.route('/edit-profile', methods=['GET', 'POST'])
+@login_required
+def edit_profile():
+    # Only allow non-admin users to edit their profile
+    if current_user.is_admin:
+        flash('Admins cannot edit user profile from here.', 'danger')
+        return redirect(url_for('admin.admin_dashboard'))
+
+    # Get current user from db
+    user = db.session.get(User, current_user.id)
+    if request.method == 'POST':
+        # Get form data
+        name = request.form.get('name')
+        email = request.form.get('email')
+        phone = request.form.get('phone')
+        address = request.form.get('address')
+        pincode = request.form.get('pincode')
+        vehicle_number = request.form.get('vehicle_number')
+        password = request.form.get('password')
+
+        # Validate and update fields
+        if name:
+            setattr(user, 'full_name', name)
+        if email:
+            user.email = email
+        if phone:
+            setattr(user, 'phone', phone)
+        if address:
+            setattr(user, 'address', address)
+        if pincode:
+            setattr(user, 'pincode', pincode)
+        if vehicle_number is not None:
+            setattr(user, 'vehicle_number', vehicle_number)
+        # Only update password if provided
+        if password:
+            user.password = generate_password_hash(password)
+        try:
+            db.session.commit()
+            flash('Profile updated successfully.', 'success')
+            return redirect(url_for('user.user_dashboard'))
+        except Exception as e:
+            db.session.rollback()
+            flash('Error updating profile. Please try again.', 'danger')
+    # Render form with current values
+    return render_template('user/edit_profile.html')
+
+@user_bp.route('/book-spot/<int:lot_id>', methods=['GET', 'POST'])
+@login_required
+def book_spot(lot_id):
+    if current_user.is_admin:
+        return redirect(url_for('admin.admin_dashboard'))
+    lot = ParkingLot.query.get_or_404(lot_id)
+    available_spots = ParkingSpot.query.filter_by(lot_id=lot_id, status='A').all()
+    if not available_spots:
+        flash('No available spots in this lot.', 'warning')
+        return redirect(url_for('user.user_dashboard'))
+    spot = available_spots[0]  # Default to first available spot
+    vehicle_number = request.form.get('vehicle_number')
+    start_time = request.form.get('start_time')
+    if request.method == 'POST':
+        # Redirect to confirmation page with booking details
+        # Pass vehicle_number and start_time as query parameters in the URL's query string
+        return redirect(url_for('user.confirm_booking', lot_id=lot_id) + f'?vehicle_number={vehicle_number or ""}&start_time={start_time or ""}')
+    return render_template('user/book_spot.html', lot=lot, spot=spot, start_time=start_time, vehicle_number=vehicle_number)
+
+@user_bp.route('/history')
+@login_required
+def user_history():
+    if current_user.is_admin:
+        return redirect(url_for('admin.admin_dashboard'))
+    history = Reservation.query.filter_by(user_id=current_user.id, is_active=False).order_by(Reservation.parking_timestamp.desc()).all()
+    return render_template('user/history.html', history=history)
+
+
+@user_bp.route('/view-spot/<int:spot_id>')
+@login_required
+def view_spot(spot_id):
+    if current_user.is_admin:
+        return redirect(url_for('admin.admin_dashboard'))
+    spot = ParkingSpot.query.get_or_404(spot_id)
+    lot = ParkingLot.query.get_or_404(spot.lot_id)
+    reservation = None
+    if spot.status == 'O':
+        reservation = Reservation.query.filter_by(spot_id=spot_id, is_active=True).first()
+    return render_template('user/view_spot.html', spot=spot, lot=lot, reservation=reservation)
+
+@user_bp.route('/dashboard')
+@login_required
+def user_dashboard():
+    if current_user.is_admin:
+        return redirect(url_for('admin.admin_dashboard'))
+    
+    # Get user's active reservation
+    active_reservation = Reservation.query.filter_by(user_id=current_user.id, is_active=True).first()
+    
+    # Get user's parking history
+    history = Reservation.query.filter_by(user_id=current_user.id, is_active=False).order_by(Reservation.parking_timestamp.desc()).all()
+    
+    # Get parking lots with available spots
+    lots_with_available_spots = db.session.query(ParkingLot).\
+        join(ParkingSpot, ParkingLot.id == ParkingSpot.lot_id).\
+        filter(ParkingSpot.status == 'A').\
+        group_by(ParkingLot.id).\
+        all()
+    
+    return render_template('user/dashboard.html', active_reservation=active_reservation, history=history, lots_with_available_spots=lots_with_available_spots, now=datetime.now())
+
+@user_bp.route('/confirm-booking/<int:lot_id>', methods=['GET', 'POST'])
+@login_required
+def confirm_booking(lot_id):
+    if current_user.is_admin:
+        return redirect(url_for('admin.admin_dashboard'))
+    active_reservation = Reservation.query.filter_by(user_id=current_user.id, is_active=True).first()
+    if active_reservation:
+        flash('You already have an active reservation', 'warning')
+        return redirect(url_for('user.user_dashboard'))
+    lot = ParkingLot.query.get_or_404(lot_id)
+    available_spot = ParkingSpot.query.filter_by(lot_id=lot_id, status='A').first()
+    vehicle_number = request.args.get('vehicle_number') or request.form.get('vehicle_number')
+    start_time = request.args.get('start_time') or request.form.get('start_time')
+    if request.method == 'POST':
+        if not available_spot:
+            flash('No parking spots available in this lot', 'danger')
+            return redirect(url_for('user.user_dashboard'))
+        new_reservation = Reservation(
+            user_id=current_user.id,
+            spot_id=available_spot.id,
+            parking_timestamp=datetime.now(),
+            is_active=True,
+            owner_name=current_user.full_name if hasattr(current_user, 'full_name') else current_user.username,
+            vehicle_number=vehicle_number
+        )
+        available_spot.status = 'O'
+        db.session.add(new_reservation)
+        db.session.commit()
+        flash(f'Spot {available_spot.spot_number} booked successfully in {lot.name}', 'success')
+        return redirect(url_for('user.user_dashboard'))
+    return render_template('user/confirm_booking.html', lot=lot, spot=available_spot, vehicle_number=vehicle_number, start_time=start_time)
+
+@user_bp.route('/release-spot/<int:reservation_id>')
+@login_required
+def release_spot(reservation_id):
+    if current_user.is_admin:
+        return redirect(url_for('admin.admin_dashboard'))
+    
+    reservation = Reservation.query.get_or_404(reservation_id)
+    
+    # Check if reservation belongs to current user
+    if reservation.user_id != current_user.id:
+        flash('Unauthorized action', 'danger')
+        return redirect(url_for('user.user_dashboard'))
+    
+    # Calculate total cost
+    spot = ParkingSpot.query.get(reservation.spot_id)
+    lot = ParkingLot.query.get(spot.lot_id)
+    
+    leaving_time = datetime.now()  # Use local time for release
+    hours_parked = (leaving_time - reservation.parking_timestamp).total_seconds() / 3600
+    total_cost = round(hours_parked * lot.price_per_hour, 2)
+    
+    # Update reservation
+    reservation.leaving_timestamp = leaving_time
+    reservation.total_cost = total_cost
+    reservation.is_active = False
+    
+    # Update spot status
+    spot.status = 'A'
+    
+    db.session.commit()
+    
+    flash(f'Parking spot released. Total cost: ₹{total_cost:.2f}', 'success')
+    return redirect(url_for('user.user_dashboard'))
@@ -0,0 +1,9 @@
+# Entry point for gunicorn, e.g. `gunicorn -c gunicorn.conf.py wsgi:app`.
+# With preload_app enabled this module is imported once in the master, so the
+# warm-up below runs before fork and every worker starts with a filled cache.
+# Without preloading each worker runs it at import; create_tables() tolerates
+# workers racing to create the schema and seed the admin.
+from app import create_app, warm_up
+
+app = create_app()
+warm_up(app)